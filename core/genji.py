@@ -9,6 +9,7 @@ from discord.ext import commands
 
 import cogs
 from playtest.manager import PlaytestManager
+from playtest.playtest_graph import shutdown_png_pool
 from utils.newsfeed import EventHandler
 from utils.notifications import NotificationService
 from utils.rabbit.client import Rabbit
@@ -80,6 +81,11 @@ class Genji(commands.Bot):
 
         self.rabbitmq_task = asyncio.create_task(self._prepare_rabbitmq())
 
+    async def close(self) -> None:
+        """Stop background worker processes before closing the bot."""
+        shutdown_png_pool()
+        await super().close()
+
     @staticmethod
     def _generate_intents() -> discord.Intents:
         """Generate intents.
@@ -183,6 +183,14 @@ class Database:
         """
         return await self.fetchval(query, user_id)
 
+    async def update_user_flags(self, user_id: int, flags: int) -> None:
+        query = "UPDATE users SET flags = $1 WHERE user_id = $2;"
+        await self.execute(query, flags, user_id)
+
+    async def update_user_nickname(self, user_id: int, nickname: str) -> None:
+        query = "UPDATE users SET nickname = $1 WHERE user_id = $2;"
+        await self.execute(query, nickname, user_id)
+
     async def fetch_all_user_names(self, user_id: int) -> list[str]:
         query = "SELECT username FROM user_overwatch_usernames WHERE user_id = $1 ORDER BY is_primary DESC"
         res = await self.fetch(query, user_id)
@@ -194,6 +202,13 @@ class Database:
         query = "SELECT EXISTS(SELECT map_code FROM maps WHERE map_code = $1)"
         return await self.fetchval(query, map_code)
 
+    async def fetch_map_names(self) -> list[str]:
+        query = "SELECT name FROM all_map_names ORDER BY name"
+        res = await self.fetch(query)
+        if not res:
+            return []
+        return [x["name"] for x in res]
+
     async def fetch_map_categories(self) -> list[str]:
         query = "SELECT name FROM all_map_types ORDER BY order_num"
         res = await self.fetch(query)
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import os
-import re  # noqa: TC003
+import re
 from typing import TYPE_CHECKING, Any, NamedTuple
 
 import discord
@@ -20,6 +20,8 @@ PLAYTEST_FORUM_ID = 1369672124352040970
 GENJI_GUILD_ID = 842778964673953812
 GENJI_API_KEY: str = os.getenv("GENJI_API_KEY", "")
 
+_CREATOR_PATTERN = re.compile(r"playtest:creatoroptions:thread:(?P<id>[0-9]+)")
+
 
 class PlaytestMetadata(msgspec.Struct):
     thread_id: int
@@ -60,10 +62,8 @@ class PlaytestManager:
             file=file,
             applied_tags=[tag]
         )
-        view = PlaytestComponentsV2View(data=data, thread_id=thread.id)
-        await message.edit(view=view)
-        total_children = sum(1 for _ in view.walk_children())
-        await thread.send(f"{total_children}")
+        # The creator select's custom_id embeds the thread id, so the view can only be attached once it exists.
+        await message.edit(view=PlaytestComponentsV2View(data=data, thread_id=thread.id))
 
         playtest_data = PlaytestMetadata(
             thread_id=thread.id,
@@ -134,10 +134,8 @@ class ModOnlySelectMenu(discord.ui.Select["PlaytestComponentsV2View"]):
         super().__init__(options=mod_only_options, placeholder="Mod Only Options")
 
     async def callback(self, interaction: Interaction) -> None:
-        is_sensei = interaction.user.get_role(constants.STAFF)
-        is_mod = interaction.user.get_role(constants.MOD)
-
-        if not (is_mod or is_sensei):
+        role_ids = {r.id for r in interaction.user.roles}
+        if constants.STAFF not in role_ids and constants.MOD not in role_ids:
             await interaction.response.send_message("You are not a mod or a sensei!", ephemeral=True)
             return
 
@@ -159,7 +157,7 @@ class ModOnlySelectMenu(discord.ui.Select["PlaytestComponentsV2View"]):
 
 class CreatorOnlySelectMenu(
     discord.ui.DynamicItem[discord.ui.Select["PlaytestComponentsV2View"]],
-    template=r'playtest:creatoroptions:thread:(?P<id>[0-9]+)'
+    template=_CREATOR_PATTERN,
 ):
     """Select creator commands."""
 
@@ -183,7 +181,7 @@ class CreatorOnlySelectMenu(
         item: discord.ui.Select,
         match: re.Match[str],
     ) -> CreatorOnlySelectMenu:
-        thread_id = int(match["id"])
+        thread_id = int(match.group(1))
         data = await cls._get_map_data(interaction.client, thread_id)
         return cls(thread_id=thread_id, data=data)
 
@@ -223,14 +221,16 @@ class PlaytestComponentsV2View(discord.ui.LayoutView):
         super().__init__(timeout=None)
         self.thread_id = thread_id
         self.data = data
+        self._content = data.build_content()
+        self._banner = data.map_banner()
         self.rebuild_components()
 
     def rebuild_components(self) -> None:
         self.clear_items()
         data_section = discord.ui.Container(
-            PlaytestLayoutViewGallery(self.data.map_banner()),
+            PlaytestLayoutViewGallery(self._banner),
             discord.ui.Separator(),
-            discord.ui.TextDisplay(content=self.data.build_content()),
+            discord.ui.TextDisplay(content=self._content),
             discord.ui.Separator(),
             discord.ui.TextDisplay(content="## Mod Only Commands"),
             discord.ui.ActionRow(ModOnlySelectMenu()),
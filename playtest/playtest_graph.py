@@ -1,7 +1,14 @@
 import asyncio
+import bisect
 import io
+import logging
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 
 import altair as alt
+import numpy as np
 import pandas as pd
 
 BUCKETS = {
@@ -43,6 +50,23 @@ COLORS = {
 
 HELL_VALUE = 10.0
 
+log = logging.getLogger(__name__)
+
+# Bucket lookups frozen once at import; buckets are contiguous, so a vote's bucket is found by bisecting the lows.
+_BUCKET_NAMES = list(BUCKETS)
+_BUCKET_NAMES_ARRAY = np.array(_BUCKET_NAMES, dtype=object)
+_BUCKET_LOWS = tuple(low for low, _ in BUCKETS.values())
+_BUCKET_LOWS_ARRAY = np.array(_BUCKET_LOWS, dtype=np.float64)
+_BUCKET_DF = pd.DataFrame({"bucket": _BUCKET_NAMES, "color": [COLORS[b] for b in _BUCKET_NAMES]})
+
+
+def _bucket_index(val: float) -> int:
+    """Return the index of the bucket containing val, or -1 if it is out of range."""
+    if not 0.0 <= val <= HELL_VALUE:
+        return -1
+    return bisect.bisect_right(_BUCKET_LOWS, val) - 1
+
+
 class VoteHistogram:
     def __init__(self, votes: list[float]) -> None:
         self.votes = votes
@@ -52,40 +76,33 @@ class VoteHistogram:
     @staticmethod
     def _find_bucket_name(val: float) -> str:
         """Return the bucket name for a given vote value (used for displaying the average)."""
-        for bucket, (low, high) in BUCKETS.items():
-            if low <= val < high or (bucket == "Hell" and val == HELL_VALUE):
-                return bucket
-        return "Unknown Difficulty"
+        idx = _bucket_index(val)
+        return _BUCKET_NAMES[idx] if idx >= 0 else "Unknown Difficulty"
 
     @staticmethod
     def _assign_bucket(val: float) -> str:
         """Assign a vote to its bucket."""
-        for bucket, (low, high) in BUCKETS.items():
-            if low <= val < high or (bucket == "Hell" and val == HELL_VALUE):
-                return bucket
-        return ""
+        idx = _bucket_index(val)
+        return _BUCKET_NAMES[idx] if idx >= 0 else ""
 
     def _prepare_data(self) -> pd.DataFrame:
         """Assign buckets and return the votes DataFrame with bucket assignments."""
-        self.df_votes['bucket'] = self.df_votes['vote'].apply(self._assign_bucket)
+        votes = self.df_votes['vote'].to_numpy(dtype=np.float64)
+        idx = np.searchsorted(_BUCKET_LOWS_ARRAY, votes, side="right") - 1
+        in_range = (votes >= 0.0) & (votes <= HELL_VALUE)
+        self.df_votes['bucket'] = np.where(in_range, _BUCKET_NAMES_ARRAY[idx.clip(0)], "")
         return self.df_votes
 
     @staticmethod
     def _create_bucket_df() -> pd.DataFrame:
-        """Create a DataFrame for bucket definitions ensuring every bucket is present."""
-        bucket_df = pd.DataFrame([
-            {"bucket": b, "color": COLORS[b]}
-            for b in BUCKETS
-        ])
-        return bucket_df
+        """Return the DataFrame of bucket definitions ensuring every bucket is present."""
+        return _BUCKET_DF
 
     @staticmethod
     def _get_bucket_for_vote(val: float) -> str:
         """Map a vote value to its bucket name."""
-        for bucket, (low, high) in BUCKETS.items():
-            if low <= val < high or (bucket == "Hell" and val == HELL_VALUE):
-                return bucket
-        return "Unknown Difficulty"
+        idx = _bucket_index(val)
+        return _BUCKET_NAMES[idx] if idx >= 0 else "Unknown Difficulty"
 
     def build_chart(self) -> alt.LayerChart:
         avg_bucket = self._get_bucket_for_vote(self.avg_vote)
@@ -94,7 +111,7 @@ class VoteHistogram:
         background = alt.Chart(self._create_bucket_df()).mark_bar(opacity=0.2).encode(
             x=alt.X(
                 "bucket:N",
-                sort=list(BUCKETS.keys()),
+                sort=_BUCKET_NAMES,
                 scale=alt.Scale(paddingInner=0, paddingOuter=0),
                 axis=alt.Axis(labels=True, title=None),
             ),
@@ -106,13 +123,13 @@ class VoteHistogram:
         avg_rule = alt.Chart(pd.DataFrame({"bucket": [avg_bucket]})).mark_rule(
             color="black", strokeDash=[4, 2], size=2
         ).encode(
-            x=alt.X("bucket:N", sort=list(BUCKETS.keys()))
+            x=alt.X("bucket:N", sort=_BUCKET_NAMES)
         )
 
         avg_circle = alt.Chart(pd.DataFrame({"bucket": [avg_bucket]})).mark_point(
             shape="circle", size=100, color="black", opacity=1, filled=True  # Full opacity and solid color
         ).encode(
-            x=alt.X("bucket:N", sort=list(BUCKETS.keys()))
+            x=alt.X("bucket:N", sort=_BUCKET_NAMES)
         )
 
         chart = alt.layer(background, avg_rule, avg_circle).properties(
@@ -129,10 +146,61 @@ class VoteHistogram:
 
         return chart
 
+    def export_png_bytes(self, scale_factor: float = 2.0) -> bytes:
+        """Render the chart to PNG bytes."""
+        buf = io.BytesIO()
+        self.build_chart().save(fp=buf, format="png", scale_factor=scale_factor)
+        return buf.getvalue()
+
     async def export_png_bytes_async(self, scale_factor: float = 2.0) -> io.BytesIO:
         """Asynchronously render the chart to PNG bytes without blocking the event loop."""
-        # Offload the blocking .to_image(...) call
-        buf = io.BytesIO()
-        await asyncio.to_thread(self.build_chart().save, fp=buf, format="png", scale_factor=scale_factor)
-        buf.seek(0)
-        return buf
+        # vl-convert is CPU bound, so concurrent renders are spread across worker processes
+        png_bytes = await _PNG_POOL.render(self.votes, scale_factor)
+        return io.BytesIO(png_bytes)
+
+
+class _PngRenderPool:
+    """Worker processes for chart rendering, started on first use and replaced if a worker dies."""
+
+    def __init__(self, max_workers: int) -> None:
+        self._max_workers = max_workers
+        self._executor: ProcessPoolExecutor | None = None
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            # Spawn rather than fork: the bot process already runs threads whose locks a fork would inherit.
+            self._executor = ProcessPoolExecutor(
+                max_workers=self._max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return self._executor
+
+    async def render(self, votes: list[float], scale_factor: float) -> bytes:
+        """Render a vote histogram to PNG bytes in a worker process."""
+        loop = asyncio.get_running_loop()
+        try:
+            return await loop.run_in_executor(self._get_executor(), _render_png_worker, votes, scale_factor)
+        except BrokenProcessPool:
+            # A dead worker (e.g. OOM) breaks the whole executor, so replace it and retry once.
+            log.warning("PNG render pool broke, restarting it.")
+            self.shutdown()
+            return await loop.run_in_executor(self._get_executor(), _render_png_worker, votes, scale_factor)
+
+    def shutdown(self) -> None:
+        """Stop the worker processes, if they were started."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+_PNG_POOL = _PngRenderPool(max_workers=min(4, os.cpu_count() or 1))
+
+
+def shutdown_png_pool() -> None:
+    """Stop the render pool's worker processes, if it was started."""
+    _PNG_POOL.shutdown()
+
+
+def _render_png_worker(votes: list[float], scale_factor: float) -> bytes:
+    """Render a vote histogram inside a pool worker; must stay top-level to be picklable."""
+    return VoteHistogram(votes).export_png_bytes(scale_factor)
@@ -59,19 +59,19 @@ STAR = "★"
 EMPTY_STAR = "☆"
 
 
+MAX_STARS = 6
+
+_STAR_TABLE = tuple(STAR * i + EMPTY_STAR * (MAX_STARS - i) for i in range(MAX_STARS + 1))
+
+
 def create_stars(rating: float | None) -> str:
     """Create stars."""
     if not rating:
         return "Unrated"
-    filled = math.ceil(rating) * STAR
-    return filled + ((6 - len(filled)) * EMPTY_STAR)
-
+    return _STAR_TABLE[min(MAX_STARS, math.ceil(rating))]
 
-def _generate_all_stars() -> list[str]:
-    return [create_stars(x) for x in range(1, 7)]
 
-
-ALL_STARS = _generate_all_stars()
+ALL_STARS = list(_STAR_TABLE[1:])
 ALL_STARS_CHOICES = [discord.app_commands.Choice(name=x, value=i) for i, x in enumerate(ALL_STARS, start=1)]
 
 # NEW_MAPS = 1060045563883700255  # Test
@@ -129,21 +129,23 @@ class Roles:
     GOD_BRONZE = 1103348814124941362
     MAP_MAKER = 1001688523067371582
 
+    _RANKS = (
+        NINJA,
+        JUMPER,
+        SKILLED,
+        PRO,
+        MASTER,
+        GRANDMASTER,
+        GOD,
+    )
+
     @classmethod
     def roles_per_rank(cls, rank_num: int) -> list[int]:
-        return cls.ranks[0 : rank_num + 1]
+        return list(cls._RANKS[0 : rank_num + 1])
 
     @classmethod
-    def ranks(cls) -> list[int]:
-        return [
-            cls.NINJA,
-            cls.JUMPER,
-            cls.SKILLED,
-            cls.PRO,
-            cls.MASTER,
-            cls.GRANDMASTER,
-            cls.GOD,
-        ]
+    def ranks(cls) -> tuple[int, ...]:
+        return cls._RANKS
 
     @classmethod
     def gold_plus(cls) -> list[int]:
@@ -192,12 +194,12 @@ class Roles:
             int: index for highest rank
 
         """
-        ids = [r.id for r in user.roles]
-        res = 0
-        for role in cls.ranks():
-            if role in ids:
-                res += 1
-        return res
+        ids = {r.id for r in user.roles}
+        ranks = cls.ranks()
+        for i in range(len(ranks) - 1, -1, -1):
+            if ranks[i] in ids:
+                return i + 1
+        return 0
 
 
 class Notification(enum.IntFlag):
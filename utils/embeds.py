@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import re
 import typing
 
 import discord
@@ -8,6 +7,24 @@ import discord
 from . import ranks
 from .constants import COMPLETION_PLACEHOLDER
 
+_STRIP_MAP_NAME = str.maketrans("", "", ":' \t\n\r\f\v")
+
+_DEFAULT_COLOR = discord.Color.from_rgb(1, 1, 1)
+_DEFAULT_THUMBNAIL = "https://i.imgur.com/qhcwGOY.png"
+_DEFAULT_IMAGE = "https://i.imgur.com/YhJokJW.png"
+
+_RECORD_DESCRIPTION = (
+    "┣ `   Code ` {code}\n"
+    "┣ `   Diff ` {difficulty}\n"
+    "┗ ` Record ` {record}\n"
+)
+_RECORD_DESCRIPTION_VIDEO = (
+    "┣ `   Code ` {code}\n"
+    "┣ `   Diff ` {difficulty}\n"
+    "┣ ` Record ` {record}\n"
+    "┗ `  Video ` [Link]({video})\n"
+)
+
 
 class GenjiEmbed(discord.Embed):
     def __init__(
@@ -20,20 +37,9 @@ class GenjiEmbed(discord.Embed):
         thumbnail: str | None = None,
         image: str | None = None,
     ) -> None:
-        if not color:
-            color = discord.Color.from_rgb(1, 1, 1)
-
-        super().__init__(color=color, title=title, url=url, description=description)
-
-        if not thumbnail:
-            self.set_thumbnail(url="https://i.imgur.com/qhcwGOY.png")
-        else:
-            self.set_thumbnail(url=thumbnail)
-
-        if not image:
-            self.set_image(url="https://i.imgur.com/YhJokJW.png")
-        else:
-            self.set_image(url=image)
+        super().__init__(color=color or _DEFAULT_COLOR, title=title, url=url, description=description)
+        self.set_thumbnail(url=thumbnail or _DEFAULT_THUMBNAIL)
+        self.set_image(url=image or _DEFAULT_IMAGE)
 
     def add_description_field(self, name: str, value: str) -> None:
         if not self.description:
@@ -80,7 +86,7 @@ def set_embed_thumbnail_maps(map_name: str, embed: discord.Embed) -> discord.Emb
         The embed object with the thumbnail set to a map's image
 
     """
-    map_name = re.sub(r"[:'\s]", "", map_name).lower()
+    map_name = map_name.translate(_STRIP_MAP_NAME).lower()
     embed.set_thumbnail(url=f"http://bkan0n.com/assets/images/map_banners/{map_name}.png")
     return embed
 
@@ -90,19 +96,14 @@ def record_embed(data: dict[str, typing.Any]) -> discord.Embed:
     if data.get("record") and data["record"] == COMPLETION_PLACEHOLDER:
         data["record"] = "Completion"
 
-    if not data.get("video"):
-        description = (
-            f"┣ `   Code ` {data['map_code']}\n"
-            f"┣ `   Diff ` {ranks.convert_num_to_difficulty(data['difficulty'])}\n"
-            f"┗ ` Record ` {data['record']}\n"
-        )
-    else:
-        description = (
-            f"┣ `   Code ` {data['map_code']}\n"
-            f"┣ `   Diff ` {ranks.convert_num_to_difficulty(data['difficulty'])}\n"
-            f"┣ ` Record ` {data['record']}\n"
-            f"┗ `  Video ` [Link]({data['video']})\n"
-        )
+    video = data.get("video")
+    template = _RECORD_DESCRIPTION_VIDEO if video else _RECORD_DESCRIPTION
+    description = template.format(
+        code=data["map_code"],
+        difficulty=ranks.convert_num_to_difficulty(data["difficulty"]),
+        record=data["record"],
+        video=video,
+    )
 
     embed = GenjiEmbed(
         title="New Submission!",
@@ -1,8 +1,8 @@
 from __future__ import annotations
 
 import asyncio
+import logging
 import os
-from logging import getLogger
 from typing import TYPE_CHECKING
 
 import msgspec
@@ -15,15 +15,19 @@ from ..newsfeed import NewsfeedEvent
 from .models import BulkArchiveMapBody, MapSubmissionBody
 
 if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
     from aio_pika.abc import AbstractIncomingMessage, AbstractQueue, AbstractRobustConnection
 
     import core
 
-log = getLogger(__name__)
+log = logging.getLogger(__name__)
 
 rabbitmq_user = os.getenv("RABBITMQ_DEFAULT_USER")
 rabbitmq_pass = os.getenv("RABBITMQ_DEFAULT_PASS")
 
+_PERSISTENT = DeliveryMode.PERSISTENT
+
 
 class Rabbit:
     _queue: AbstractQueue
@@ -33,6 +37,14 @@ class Rabbit:
         self._bot = bot
         self._connection_pool = Pool(self.get_connection, max_size=2)
         self._channel_pool = Pool(self.get_channel, max_size=10)
+        self._playtest_decoder = msgspec.json.Decoder(MapModel)
+        self._bulk_archive_decoder = msgspec.json.Decoder(list[BulkArchiveMapBody])
+        self._handlers: dict[str, Callable[[str, AbstractIncomingMessage], Awaitable[None]]] = {
+            "playtest": self._handle_playtest,
+            "bulk_archive": self._handle_bulk_archive,
+            "bulk_unarchive": self._handle_bulk_archive,
+            "legacy": self._handle_legacy,
+        }
         self._queue_creation_task = asyncio.create_task(self._set_up_queue())
 
     async def _set_up_queue(self) -> None:
@@ -66,9 +78,10 @@ class Rabbit:
 
     async def publish(self, queue_name: str, json_data: bytes) -> None:
         async with self._channel_pool.acquire() as channel:
-            message = Message(json_data, delivery_mode=DeliveryMode.PERSISTENT)
+            message = Message(json_data, delivery_mode=_PERSISTENT)
             await channel.default_exchange.publish(message, routing_key=queue_name)
-            log.debug(f"[x] [RabbitMQ] Published message to {queue_name}:\n{message}")
+            if log.isEnabledFor(logging.DEBUG):
+                log.debug(f"[x] [RabbitMQ] Published message to {queue_name}:\n{message}")
 
     async def _process_message(self, message: AbstractIncomingMessage) -> None:
         async with message.process():
@@ -76,21 +89,23 @@ class Rabbit:
             if message.headers.get("x-test-mode"):
                 return
             assert isinstance(x_type, str)
-            match x_type:
-                case "playtest":
-                    decoded_json = msgspec.json.decode(message.body, type=MapModel)
-                    # _data = decoded_json.rabbit_data
-                    await self._bot.playtest_manager.add_playtest(decoded_json)
-                    # TODO: Check if MOD, else send to playtestmanager
-                    return
-                case "bulk_archive" | "bulk_unarchive":
-                    decoded_json = msgspec.json.decode(message.body, type=list[BulkArchiveMapBody])
-                    _data = [_d.rabbit_data for _d in decoded_json]
-                case "legacy":
-                    ...
-                    # decoded_json = msgspec.json.decode(message.body, type=BulkLegacyBody)
-                case _:
-                    return
-
-            event = NewsfeedEvent(x_type, _data)
-            await self._bot.genji_dispatch.handle_event(event, self._bot)
+            handler = self._handlers.get(x_type)
+            if handler is None:
+                return
+            await handler(x_type, message)
+
+    async def _handle_playtest(self, x_type: str, message: AbstractIncomingMessage) -> None:
+        decoded_json = self._playtest_decoder.decode(message.body)
+        # _data = decoded_json.rabbit_data
+        await self._bot.playtest_manager.add_playtest(decoded_json)
+        # TODO: Check if MOD, else send to playtestmanager
+
+    async def _handle_bulk_archive(self, x_type: str, message: AbstractIncomingMessage) -> None:
+        decoded_json = self._bulk_archive_decoder.decode(message.body)
+        _data = [_d.rabbit_data for _d in decoded_json]
+        event = NewsfeedEvent(x_type, _data)
+        await self._bot.genji_dispatch.handle_event(event, self._bot)
+
+    async def _handle_legacy(self, x_type: str, message: AbstractIncomingMessage) -> None:
+        ...
+        # decoded_json = msgspec.json.decode(message.body, type=BulkLegacyBody)
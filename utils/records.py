@@ -1,23 +1,26 @@
 from __future__ import annotations
 
-import datetime
-import re
+import bisect
+import functools
 import typing
 
 import discord
 from discord import Embed
 
-from . import constants, embeds, ranks, utils
+from . import constants, embeds, ranks
 
 if typing.TYPE_CHECKING:
     import decimal
 
-    import asyncpg
-
     import database
 
 
-CODE_VERIFICATION = re.compile(r"^[A-Z0-9]{4,6}$")
+_TWO_DIGITS = tuple(f"{i:02d}" for i in range(100))
+
+_ORDINAL_SUFFIXES = tuple(
+    "th" if 11 <= i <= 13 else ("th", "st", "nd", "rd", "th")[min(i % 10, 4)]  # noqa: PLR2004
+    for i in range(100)
+)
 
 
 def pretty_record(record: decimal.Decimal | float) -> str:
@@ -31,151 +34,200 @@ def pretty_record(record: decimal.Decimal | float) -> str:
     """
     record = float(round(record, 2))
     negative = "-" if record < 0 else ""
-    dt = datetime.datetime.min + datetime.timedelta(seconds=abs(record))
-    hour_remove = 0
-    seconds_remove = -4
-
-    if dt.hour == 0 and dt.minute == 0:
-        hour_remove = 6
-        if dt.second < 10:  # noqa: PLR2004
-            hour_remove += 1
-
-    elif dt.hour == 0:
-        hour_remove = 3
-        if dt.minute < 10:  # noqa: PLR2004
-            hour_remove = 4
-
-    if dt.microsecond == 0:
-        seconds_remove = -4
-
-    return negative + dt.strftime("%H:%M:%S.%f")[hour_remove:seconds_remove]
-
-
-def icon_generator(record: asyncpg.Record, medals: tuple[float, float, float]) -> str:
-    """Generate icon for embed."""
-    icon = ""
-    if record["video"] and record["record"] != "Completion":
-        if record["record"] < medals[0] != 0:
-            icon = constants.GOLD_WR if record.get("rank_num", 0) == 1 else constants.FULLY_VERIFIED_GOLD
-        elif record["record"] < medals[1] != 0:
-            icon = constants.SILVER_WR if record.get("rank_num", 0) == 1 else constants.FULLY_VERIFIED_SILVER
-        elif record["record"] < medals[2] != 0:
-            icon = constants.BRONZE_WR if record.get("rank_num", 0) == 1 else constants.FULLY_VERIFIED_BRONZE
-        elif record.get("rank_num", 0) == 1:
-            icon = constants.NON_MEDAL_WR
-        else:
-            icon = constants.FULLY_VERIFIED
-    elif record["record"] != "Completion":
-        icon = constants.PARTIAL_VERIFIED
-    return icon
+    hundredths = round(abs(record) * 100)
+    seconds, hundredths = divmod(hundredths, 100)
+    minutes, seconds = divmod(seconds, 60)
+    hours, minutes = divmod(minutes, 60)
+
+    if hours:
+        hours_str = _TWO_DIGITS[hours] if hours < 100 else str(hours)  # noqa: PLR2004
+        res = hours_str + ":" + _TWO_DIGITS[minutes] + ":" + _TWO_DIGITS[seconds]
+    elif minutes:
+        res = str(minutes) + ":" + _TWO_DIGITS[seconds]
+    else:
+        res = str(seconds)
+    return negative + res + "." + _TWO_DIGITS[hundredths]
+
+
+_MEDAL_ICONS = (
+    (constants.FULLY_VERIFIED_GOLD, constants.GOLD_WR),
+    (constants.FULLY_VERIFIED_SILVER, constants.SILVER_WR),
+    (constants.FULLY_VERIFIED_BRONZE, constants.BRONZE_WR),
+)
+
+
+@functools.lru_cache(maxsize=128)
+def _medal_table(
+    medals: tuple[decimal.Decimal | float, decimal.Decimal | float, decimal.Decimal | float],
+) -> tuple[tuple[float, ...], tuple[tuple[str, str], ...]]:
+    """Build bisectable medal thresholds and their (normal, world record) icons.
+
+    Medals are converted to float here, once per distinct medal set. A medal of 0 is unset
+    and skipped. Thresholds are kept as a running maximum so that bisecting finds the first
+    medal, in gold/silver/bronze order, that the record beats.
+    """
+    thresholds = []
+    icons = []
+    highest = None
+    for raw_medal, medal_icons in zip(medals, _MEDAL_ICONS):
+        medal = float(raw_medal)
+        if medal == 0:
+            continue
+        highest = medal if highest is None else max(highest, medal)
+        thresholds.append(highest)
+        icons.append(medal_icons)
+    return tuple(thresholds), tuple(icons)
+
+
+def icon_generator(
+    is_video: bool,
+    record: decimal.Decimal | float | None,
+    is_wr: bool,
+    medals: tuple[tuple[float, ...], tuple[tuple[str, str], ...]],
+    _partial_verified: str = constants.PARTIAL_VERIFIED,
+    _non_medal_wr: str = constants.NON_MEDAL_WR,
+    _fully_verified: str = constants.FULLY_VERIFIED,
+) -> str:
+    """Generate icon for embed.
+
+    record is None for completions. medals is a table built by _medal_table.
+    The underscored defaults bind icons as locals and are not meant to be passed.
+    """
+    if record is None:
+        return ""
+    if not is_video:
+        return _partial_verified
+    thresholds, icons = medals
+    idx = bisect.bisect_right(thresholds, record)
+    if idx < len(thresholds):
+        return icons[idx][is_wr]
+    return _non_medal_wr if is_wr else _fully_verified
+
+
+_NO_LEGACY_MEDAL = (-9999999, -9999999, -9999999)
+_LEGACY_MEDALS = {
+    "Gold": (9999999, -9999999, -9999999),
+    "Silver": (-9999999, 9999999, -9999999),
+    "Bronze": (-9999999, -9999999, 9999999),
+}
+
+
+def _record_values(records: list[database.DotRecord]) -> list[float | None]:
+    """Convert every record time to float in one pass; completions become None."""
+    values = [float(record.record) for record in records]
+    return [None if value == constants.COMPLETION_PLACEHOLDER else value for value in values]
 
 
 def all_levels_records_embed(
     records: list[database.DotRecord],
     title: str,
     legacy: bool = False,
-) -> list[Embed | embeds.GenjiEmbed]:
-    """Generate embed for All Levels Record."""
-    embed_list = []
+) -> typing.Iterator[Embed | embeds.GenjiEmbed]:
+    """Generate embeds for All Levels Record, one page at a time."""
     embed = embeds.GenjiEmbed(title=title)
-    for i, record in enumerate(records):
-        if float(record.record) == constants.COMPLETION_PLACEHOLDER:
+    values = _record_values(records)
+    names = [discord.utils.escape_markdown(record.nickname) for record in records]
+    placements_get = constants.PLACEMENTS.get
+    last = len(records) - 1
+    for i, (record, value) in enumerate(zip(records, values)):
+        if value is None:
             record.record = "Completion"
         if legacy:
-            medals = (
-                9999999 if record.medal == "Gold" else -9999999,
-                9999999 if record.medal == "Silver" else -9999999,
-                9999999 if record.medal == "Bronze" else -9999999,
-            )
+            medals = _LEGACY_MEDALS.get(record.medal, _NO_LEGACY_MEDAL)
         elif record.gold:
             medals = (record.gold, record.silver, record.bronze)
-            medals = tuple(map(float, medals))
         else:
             medals = (0, 0, 0)
+        icon = icon_generator(
+            bool(record.video),
+            value,
+            record.get("rank_num", 0) == 1,
+            _medal_table(medals),
+        )
         if not record.video:
             description = (
-                f"┣ `Name` {discord.utils.escape_markdown(record.nickname)}\n"
+                f"┣ `Name` {names[i]}\n"
                 f"┗ `Record` [{record.record}]"
                 f"({record.screenshot}) "
-                f"{icon_generator(record, medals)}\n"
+                f"{icon}\n"
             )
         else:
             description = (
-                f"┣ `Name` {discord.utils.escape_markdown(record.nickname)}\n"
+                f"┣ `Name` {names[i]}\n"
                 f"┣ `Record` [{record.record}]"
                 f"({record.screenshot}) "
-                f"{icon_generator(record, medals)}\n "
+                f"{icon}\n "
                 f"┗ `Video` [Link]({record.video})\n"
             )
         embed.add_field(
-            name=f"{constants.PLACEMENTS.get(i + 1, '')} {make_ordinal(i + 1)}",
+            name=f"{placements_get(i + 1, '')} {make_ordinal(i + 1)}",
             # if single
             # else record.level_name,
             value=description,
             inline=False,
         )
-        if utils.split_nth_iterable(current=i, iterable=records, split=10):
-            embed = embeds.set_embed_thumbnail_maps(record.map_name, embed)
-            embed_list.append(embed)
+        if (i + 1) % 10 == 0 or i == last:
+            yield embeds.set_embed_thumbnail_maps(record.map_name, embed)
             embed = embeds.GenjiEmbed(title=title)
-    return embed_list
+
+
+_LEGEND_TEXT = (
+    f"{constants.PARTIAL_VERIFIED} Completion\n"
+    f"{constants.FULLY_VERIFIED} Verified\n"
+    f"{constants.NON_MEDAL_WR} No Medal w/ World Record\n\n"
+    f"{constants.FULLY_VERIFIED_BRONZE} Bronze Medal\n"
+    f"{constants.BRONZE_WR} Bronze Medal w/ World Record\n\n"
+    f"{constants.FULLY_VERIFIED_SILVER} Silver Medal\n"
+    f"{constants.SILVER_WR} Silver Medal w/ World Record\n\n"
+    f"{constants.FULLY_VERIFIED_GOLD} Gold Medal\n"
+    f"{constants.GOLD_WR} Gold Medal w/ World Record\n"
+)
 
 
 def pr_records_embed(
     records: list[database.DotRecord],
     title: str,
-) -> list[Embed | embeds.GenjiEmbed]:
-    """Generate embed for PR Record."""
-    embed_list = []
+) -> typing.Iterator[Embed | embeds.GenjiEmbed]:
+    """Generate embeds for PR Record, one page at a time."""
     _embed = embeds.GenjiEmbed(title=title)
-    for i, record in enumerate(records):
-        if float(record.record) == constants.COMPLETION_PLACEHOLDER:
+    values = _record_values(records)
+    difficulties = {record.difficulty: ranks.convert_num_to_difficulty(record.difficulty) for record in records}
+    last = len(records) - 1
+    for i, (record, value) in enumerate(zip(records, values)):
+        if value is None:
             record.record = "Completion"
         cur_code = f"{record.map_name} by {record.creators} ({record.map_code})"
-        description = ""
-        if record.gold:
-            medals = (record.gold, record.silver, record.bronze)
-            medals = tuple(map(float, medals))
-        else:
-            medals = (0, 0, 0)
+        medals = (record.gold, record.silver, record.bronze) if record.gold else (0, 0, 0)
+        icon = icon_generator(
+            bool(record.video),
+            value,
+            record.get("rank_num", 0) == 1,
+            _medal_table(medals),
+        )
         if not record.video:
-            description += (
-                f"┣ `Difficulty` {ranks.convert_num_to_difficulty(record.difficulty)}\n"
-                f"┣ `Record` [{record.record}]"
+            description = (
+                f"┣ `Difficulty` {difficulties[record.difficulty]}\n"
+                f"┗ `Record` [{record.record}]"
                 f"({record.screenshot}) "
-                f"{icon_generator(record, medals)}\n┃\n"
+                f"{icon}"
             )
         else:
-            description += (
-                f"┣ `Difficulty` {ranks.convert_num_to_difficulty(record.difficulty)}\n"
+            description = (
+                f"┣ `Difficulty` {difficulties[record.difficulty]}\n"
                 f"┣ `Record` [{record.record}]"
                 f"({record.screenshot})"
-                f"{icon_generator(record, medals)}\n "
-                f"┣ `Video` [Link]({record.video})\n┃\n"
+                f"{icon}\n "
+                f"┗ `Video` [Link]({record.video})"
             )
         _embed.add_field(
             name=f"{cur_code}",
-            value="┗".join(description[:-3].rsplit("┣", 1)),
+            value=description,
             inline=False,
         )
-        if utils.split_nth_iterable(current=i, iterable=records, split=10):
-            _embed.add_field(
-                name="Legend",
-                value=(
-                    f"{constants.PARTIAL_VERIFIED} Completion\n"
-                    f"{constants.FULLY_VERIFIED} Verified\n"
-                    f"{constants.NON_MEDAL_WR} No Medal w/ World Record\n\n"
-                    f"{constants.FULLY_VERIFIED_BRONZE} Bronze Medal\n"
-                    f"{constants.BRONZE_WR} Bronze Medal w/ World Record\n\n"
-                    f"{constants.FULLY_VERIFIED_SILVER} Silver Medal\n"
-                    f"{constants.SILVER_WR} Silver Medal w/ World Record\n\n"
-                    f"{constants.FULLY_VERIFIED_GOLD} Gold Medal\n"
-                    f"{constants.GOLD_WR} Gold Medal w/ World Record\n"
-                ),
-            )
-            embed_list.append(_embed)
+        if (i + 1) % 10 == 0 or i == last:
+            _embed.add_field(name="Legend", value=_LEGEND_TEXT)
+            yield _embed
             _embed = embeds.GenjiEmbed(title=title)
-    return embed_list
 
 
 def make_ordinal(n: int) -> str:
@@ -186,8 +238,4 @@ def make_ordinal(n: int) -> str:
     make_ordinal(122) => '122nd'
     make_ordinal(213) => '213th'
     """
-    n = int(n)
-    suffix = ["th", "st", "nd", "rd", "th"][min(n % 10, 4)]
-    if 11 <= (n % 100) <= 13:  # noqa: PLR2004
-        suffix = "th"
-    return str(n) + suffix
+    return f"{n}{_ORDINAL_SUFFIXES[n % 100]}"
@@ -1,12 +1,12 @@
 from __future__ import annotations
 
-import re
+import string
+import time
 from typing import TYPE_CHECKING
 
 from discord import app_commands
 
 from . import constants, errors, utils
-from .records import CODE_VERIFICATION
 
 if TYPE_CHECKING:
     import discord
@@ -14,91 +14,189 @@ if TYPE_CHECKING:
     import core
 
 
-async def transform_user(client: core.Genji, value: str) -> utils.FakeUser | discord.Member:
+_MAP_CODE_CHARS = frozenset(string.ascii_uppercase + string.digits)
+_CLEAN_CODE_TABLE = str.maketrans(
+    {**dict(zip(string.ascii_lowercase, string.ascii_uppercase)), "O": "0", "o": "0"},
+)
+
+
+def _is_valid_code(value: str) -> bool:
+    """Check a cleaned map code is 4-6 characters of A-Z/0-9."""
+    return 4 <= len(value) <= 6 and _MAP_CODE_CHARS.issuperset(value)  # noqa: PLR2004
+
+
+_NAME_CACHE_TTL = 300
+_name_cache: dict[str, tuple[float, dict[str, str]]] = {}
+
+
+async def _cached_names(client: core.Genji, fetcher: str) -> dict[str, str]:
+    """Map casefolded names to names from a Database fetch helper, reusing them for _NAME_CACHE_TTL seconds.
+
+    Names are matched casefolded, like pg_trgm's case-insensitive similarity().
+    """
+    now = time.monotonic()
+    cached = _name_cache.get(fetcher)
+    if cached and now - cached[0] < _NAME_CACHE_TTL:
+        return cached[1]
+    names = {name.casefold(): name for name in await getattr(client.database, fetcher)()}
+    _name_cache[fetcher] = (now, names)
+    return names
+
+
+# Autocomplete queries are kept as module constants for readability; asyncpg caches the prepared statements either way.
+_CREATOR_AUTOCOMPLETE_QUERY = """
+    WITH creator_ids AS (
+        SELECT DISTINCT user_id FROM map_creators
+    ),
+    matched_names AS (
+        SELECT u.user_id, name
+        FROM users u
+        JOIN creator_ids c ON u.user_id = c.user_id
+        CROSS JOIN LATERAL (
+            VALUES (u.nickname), (u.global_name)
+        ) AS name_list(name)
+        WHERE name % $1
+
+        UNION
+
+        SELECT o.user_id, o.username AS name
+        FROM user_overwatch_usernames o
+        JOIN creator_ids c ON o.user_id = c.user_id
+        WHERE o.username % $1
+    ),
+    ranked_creators AS (
+        SELECT user_id, MAX(similarity(name, $1)) AS sim
+        FROM matched_names
+        GROUP BY user_id
+        ORDER BY sim DESC
+        LIMIT 6
+    ),
+    creator_names AS (
+        SELECT
+            u.user_id,
+            ARRAY_REMOVE(
+                ARRAY[
+                    u.nickname,
+                    u.global_name
+                ] || ARRAY_AGG(DISTINCT own_all.username),
+                NULL
+            ) AS all_usernames
+        FROM ranked_creators rc
+        JOIN users u ON u.user_id = rc.user_id
+        LEFT JOIN user_overwatch_usernames own_all ON u.user_id = own_all.user_id
+        GROUP BY u.user_id, u.nickname, u.global_name, sim
+        ORDER BY sim DESC
+    )
+    SELECT user_id, ARRAY(SELECT DISTINCT * FROM unnest(all_usernames)) AS all_usernames FROM creator_names;
+"""
+
+_ALL_USER_AUTOCOMPLETE_QUERY = """
+    WITH matches AS (
+        SELECT u.user_id, name
+        FROM users u
+        CROSS JOIN LATERAL (
+            VALUES (u.nickname), (u.global_name)
+        ) AS name_list(name)
+        WHERE name % $1
+
+        UNION
+
+        SELECT o.user_id, o.username AS name
+        FROM user_overwatch_usernames o
+        WHERE o.username % $1
+    ),
+    ranked_users AS (
+        SELECT user_id, MAX(similarity(name, $1)) AS sim
+        FROM matches
+        GROUP BY user_id
+        ORDER BY sim DESC
+        LIMIT 10
+    ),
+    user_names AS (
+        SELECT
+            u.user_id,
+            ARRAY_REMOVE(
+                ARRAY[
+                    u.nickname,
+                    u.global_name
+                ] || ARRAY_AGG(DISTINCT own_all.username),
+                NULL
+            ) AS all_usernames
+        FROM ranked_users ru
+        JOIN users u ON u.user_id = ru.user_id
+        LEFT JOIN user_overwatch_usernames own_all ON u.user_id = own_all.user_id
+        GROUP BY u.user_id, u.nickname, u.global_name, sim
+        ORDER BY sim DESC
+    )
+    SELECT user_id, ARRAY(SELECT DISTINCT * FROM unnest(all_usernames)) AS all_usernames FROM user_names;
+"""
+
+
+async def transform_user(client: core.Genji, value: str | int) -> utils.FakeUser | discord.Member:
     """Transform user."""
     guild = client.get_guild(constants.GUILD_ID)
     assert guild
-    try:
-        _value = int(value)
-        member = guild.get_member(_value)
-        if member:
-            return member
-        nickname = await client.database.fetch_nickname(_value)
-        return utils.FakeUser(_value, nickname)
-    except ValueError:
-        raise errors.UserNotFoundError
-
-
-class MapNameTransformer(app_commands.Transformer):
-    async def transform(self, itx: discord.Interaction[core.Genji], value: str) -> str:
-        query = "SELECT name FROM all_map_names ORDER BY similarity(name, $1::text) DESC LIMIT 1;"
-        return await itx.client.database.fetchval(query, value)
+    if isinstance(value, str):
+        # Display names reach here from AllUserTransformer; reject them without raising through int().
+        value = value.strip()
+        # isdecimal matches exactly the digits int() accepts; isdigit also passes e.g. superscripts.
+        if not value.removeprefix("-").isdecimal():
+            raise errors.UserNotFoundError
+    _value = int(value)
+    member = guild.get_member(_value)
+    if member:
+        return member
+    nickname = await client.database.fetch_nickname(_value)
+    return utils.FakeUser(_value, nickname)
 
-    async def autocomplete(
-        self,
-        itx: discord.Interaction[core.Genji],
-        current: str,
-    ) -> list[app_commands.Choice[str]]:
-        query = "SELECT name FROM all_map_names ORDER BY similarity(name, $1::text) DESC LIMIT 10;"
-        names = await itx.client.database.fetch(query, current)
-        return [app_commands.Choice(name=x, value=x) for (x,) in names]
 
+class _LookupTableTransformer(app_commands.Transformer):
+    """Fuzzy-match a value against the names returned by a Database fetch helper."""
 
-class MapTypesTransformer(app_commands.Transformer):
-    async def transform(self, itx: discord.Interaction[core.Genji], value: str) -> str:
-        query = "SELECT name FROM all_map_types ORDER BY similarity(name, $1::text) DESC LIMIT 1;"
-        return await itx.client.database.fetchval(query, value)
+    fetcher: str
+
+    async def transform(self, itx: discord.Interaction[core.Genji], value: str) -> str | None:
+        names = await _cached_names(itx.client, self.fetcher)
+        if not names:
+            return None
+        return names[utils.fuzz_(value.casefold(), names)]
 
     async def autocomplete(
         self,
         itx: discord.Interaction[core.Genji],
         current: str,
     ) -> list[app_commands.Choice[str]]:
-        query = "SELECT name FROM all_map_types ORDER BY similarity(name, $1::text) DESC LIMIT 10;"
-        types = await itx.client.database.fetch(query, current)
-        return [app_commands.Choice(name=x, value=x) for (x,) in types]
+        names = await _cached_names(itx.client, self.fetcher)
+        matches = [names[x] for x in utils.fuzz_multiple(current.casefold(), names)]
+        return [app_commands.Choice(name=x, value=x) for x in matches]
 
 
-class MapMechanicsTransformer(app_commands.Transformer):
-    async def transform(self, itx: discord.Interaction[core.Genji], value: str) -> str:
-        query = "SELECT name FROM all_map_mechanics ORDER BY similarity(name, $1::text) DESC LIMIT 1;"
-        return await itx.client.database.fetchval(query, value)
+class MapNameTransformer(_LookupTableTransformer):
+    fetcher = "fetch_map_names"
 
-    async def autocomplete(
-        self,
-        itx: discord.Interaction[core.Genji],
-        current: str,
-    ) -> list[app_commands.Choice[str]]:
-        query = "SELECT name FROM all_map_mechanics ORDER BY similarity(name, $1::text) DESC LIMIT 10;"
-        mechanics = await itx.client.database.fetch(query, current)
-        return [app_commands.Choice(name=x, value=x) for (x,) in mechanics]
 
+class MapTypesTransformer(_LookupTableTransformer):
+    fetcher = "fetch_map_categories"
 
-class MapRestrictionsTransformer(app_commands.Transformer):
-    async def transform(self, itx: discord.Interaction[core.Genji], value: str) -> str:
-        query = "SELECT name FROM all_map_restrictions ORDER BY similarity(name, $1::text) DESC LIMIT 1;"
-        return await itx.client.database.fetchval(query, value)
 
-    async def autocomplete(
-        self,
-        itx: discord.Interaction[core.Genji],
-        current: str,
-    ) -> list[app_commands.Choice[str]]:
-        query = "SELECT name FROM all_map_restrictions ORDER BY similarity(name, $1::text) DESC LIMIT 10;"
-        restrictions = await itx.client.database.fetch(query, current)
-        return [app_commands.Choice(name=x, value=x) for (x,) in restrictions]
+class MapMechanicsTransformer(_LookupTableTransformer):
+    fetcher = "fetch_map_mechanics"
+
+
+class MapRestrictionsTransformer(_LookupTableTransformer):
+    fetcher = "fetch_map_restrictions"
 
 
 class _MapCodeBaseTransformer(app_commands.Transformer):
     @staticmethod
     def _clean_code(map_code: str) -> str:
-        return map_code.upper().replace("O", "0").lstrip().rstrip()
+        return map_code.translate(_CLEAN_CODE_TABLE).strip()
 
 
 class MapCodeSubmitTransformer(_MapCodeBaseTransformer):
     async def transform(self, itx: discord.Interaction[core.Genji], value: str) -> str:
         value = self._clean_code(value)
-        if not re.match(CODE_VERIFICATION, value):
+        if not _is_valid_code(value):
             raise errors.IncorrectCodeFormatError
         if await itx.client.database.is_existing_map_code(value):
             raise errors.MapExistsError
@@ -115,7 +213,7 @@ class _MapCodeAutocompleteBaseTransformer(_MapCodeBaseTransformer):
 class MapCodeTransformer(_MapCodeAutocompleteBaseTransformer):
     async def transform(self, itx: discord.Interaction[core.Genji], value: str) -> str:
         value = self._clean_code(value)
-        if not re.match(CODE_VERIFICATION, value):
+        if not _is_valid_code(value):
             raise errors.IncorrectCodeFormatError
         query = "SELECT map_code FROM maps WHERE archived = FALSE ORDER BY similarity(map_code, $1) DESC LIMIT 1;"
         res = await itx.client.database.fetch(query, value)
@@ -132,7 +230,7 @@ class MapCodeAllTransformer(_MapCodeBaseTransformer):
 
     async def transform(self, itx: discord.Interaction[core.Genji], value: str) -> str:
         value = self._clean_code(value)
-        if not re.match(CODE_VERIFICATION, value):
+        if not _is_valid_code(value):
             raise errors.IncorrectCodeFormatError
         query = "SELECT map_code FROM maps ORDER BY similarity(map_code, $1) DESC LIMIT 1;"
         res = await itx.client.database.fetch(query, value)
@@ -148,7 +246,7 @@ class MapCodeRecordsTransformer(_MapCodeAutocompleteBaseTransformer):
         if not await itx.client.database.is_existing_map_code(value):
             raise errors.InvalidMapCodeError
 
-        if not re.match(CODE_VERIFICATION, value):
+        if not _is_valid_code(value):
             raise errors.IncorrectCodeFormatError
 
         return value
@@ -163,52 +261,7 @@ class CreatorTransformer(app_commands.Transformer):
             return user.id
 
     async def autocomplete(self, itx: discord.Interaction[core.Genji], current: str) -> list[app_commands.Choice[str]]:
-        query = """
-            WITH creator_ids AS (
-                SELECT DISTINCT user_id FROM map_creators
-            ),
-            matched_names AS (
-                SELECT u.user_id, name
-                FROM users u
-                JOIN creator_ids c ON u.user_id = c.user_id
-                CROSS JOIN LATERAL (
-                    VALUES (u.nickname), (u.global_name)
-                ) AS name_list(name)
-                WHERE name % $1
-            
-                UNION
-            
-                SELECT o.user_id, o.username AS name
-                FROM user_overwatch_usernames o
-                JOIN creator_ids c ON o.user_id = c.user_id
-                WHERE o.username % $1
-            ),
-            ranked_creators AS (
-                SELECT user_id, MAX(similarity(name, $1)) AS sim
-                FROM matched_names
-                GROUP BY user_id
-                ORDER BY sim DESC
-                LIMIT 6
-            ),
-            creator_names AS (
-                SELECT
-                    u.user_id,
-                    ARRAY_REMOVE(
-                        ARRAY[
-                            u.nickname,
-                            u.global_name
-                        ] || ARRAY_AGG(DISTINCT own_all.username),
-                        NULL
-                    ) AS all_usernames
-                FROM ranked_creators rc
-                JOIN users u ON u.user_id = rc.user_id
-                LEFT JOIN user_overwatch_usernames own_all ON u.user_id = own_all.user_id
-                GROUP BY u.user_id, u.nickname, u.global_name, sim
-                ORDER BY sim DESC
-            )
-            SELECT user_id, ARRAY(SELECT DISTINCT * FROM unnest(all_usernames)) AS all_usernames FROM creator_names;
-        """
-        results = await itx.client.database.fetch(query, current)
+        results = await itx.client.database.fetch(_CREATOR_AUTOCOMPLETE_QUERY, current)
         return [
             app_commands.Choice(name=f"{', '.join(row['all_usernames'])} ({row['user_id']})"[:100], value=str(row["user_id"]))
             for row in results
@@ -220,48 +273,7 @@ class AllUserTransformer(app_commands.Transformer):
         return await transform_user(itx.client, value)
 
     async def autocomplete(self, itx: discord.Interaction[core.Genji], current: str) -> list[app_commands.Choice[str]]:
-        query = """
-        WITH matches AS (
-            SELECT u.user_id, name
-            FROM users u
-            CROSS JOIN LATERAL (
-                VALUES (u.nickname), (u.global_name)
-            ) AS name_list(name)
-            WHERE name % $1
-        
-            UNION
-        
-            SELECT o.user_id, o.username AS name
-            FROM user_overwatch_usernames o
-            WHERE o.username % $1
-        ),
-        ranked_users AS (
-            SELECT user_id, MAX(similarity(name, $1)) AS sim
-            FROM matches
-            GROUP BY user_id
-            ORDER BY sim DESC
-            LIMIT 10
-        ),
-        user_names AS (
-            SELECT
-                u.user_id,
-                ARRAY_REMOVE(
-                    ARRAY[
-                        u.nickname,
-                        u.global_name
-                    ] || ARRAY_AGG(DISTINCT own_all.username),
-                    NULL
-                ) AS all_usernames
-            FROM ranked_users ru
-            JOIN users u ON u.user_id = ru.user_id
-            LEFT JOIN user_overwatch_usernames own_all ON u.user_id = own_all.user_id
-            GROUP BY u.user_id, u.nickname, u.global_name, sim
-            ORDER BY sim DESC
-        )
-        SELECT user_id, ARRAY(SELECT DISTINCT * FROM unnest(all_usernames)) AS all_usernames FROM user_names;
-
-        """
-        results = await itx.client.database.fetch(query, current)
+        results = await itx.client.database.fetch(_ALL_USER_AUTOCOMPLETE_QUERY, current)
         return [
             app_commands.Choice(name=f"{', '.join(row['all_usernames'])} ({row['user_id']})"[:100], value=str(row["user_id"]))
             for row in results
@@ -301,28 +313,35 @@ class URLTransformer(app_commands.Transformer):
         if not value.startswith("https://") and not value.startswith("http://"):
             value = "https://" + value
         try:
-            async with itx.client.session.get(value) as resp:
-                if resp.status != 200:  # noqa: PLR2004
-                    raise errors.IncorrectURLFormatError
-                return str(resp.url)
+            # HEAD avoids downloading linked media. Some hosts refuse HEAD (403/404/405) but serve GET, so retry with GET.
+            async with itx.client.session.head(value, allow_redirects=True) as resp:
+                status, url = resp.status, resp.url
+            if status != 200:  # noqa: PLR2004
+                async with itx.client.session.get(value) as resp:
+                    status, url = resp.status, resp.url
+            if status != 200:  # noqa: PLR2004
+                raise errors.IncorrectURLFormatError
+            return str(url)
         except Exception:
             raise errors.IncorrectURLFormatError
 
 
 def time_convert(string: str) -> float:
     """Convert HH:MM:SS.ss string into seconds (float)."""
-    negative = -1 if string[0] == "-" else 1
-    time = string.split(":")
-    match len(time):
-        case 1:
-            res = float(time[0])
-        case 2:
-            res = float((int(time[0]) * 60) + (negative * float(time[1])))
-        case 3:
-            res = float((int(time[0]) * 3600) + (negative * (int(time[1]) * 60)) + (negative * float(time[2])))
-        case _:
-            raise ValueError("Failed to match any cases.")
-    return round(res, 2)
+    negative = -1 if string.startswith("-") else 1
+    first = string.find(":")
+    if first == -1:
+        return round(float(string), 2)
+    second = string.find(":", first + 1)
+    if second == -1:
+        res = int(string[:first]) * 60 + negative * float(string[first + 1 :])
+    else:
+        res = (
+            int(string[:first]) * 3600
+            + negative * int(string[first + 1 : second]) * 60
+            + negative * float(string[second + 1 :])
+        )
+    return round(float(res), 2)
 
 
 class KeyTypeTransformer(app_commands.Transformer):
@@ -288,6 +288,8 @@ def find_highest_rank(data: list[RankDetail]) -> str:
 
 
 class FakeUser:
+    __slots__ = ("display_avatar", "id", "mention", "nickname")
+
     def __init__(self, id_: int, nickname: str) -> None:
         self.id = id_
         self.nickname = nickname
@@ -371,9 +373,6 @@ class SettingFlags(enum.IntFlag):
     DEFAULT = VERIFICATION | PROMOTION
     NONE = 0
 
-    def get_new_flag(self, value: int) -> int:
-        return self.value ^ value
-
 
 def sanitize_string_no_spaces(string: str | None) -> str:
     """Sanitize string."""
@@ -1,8 +1,8 @@
 from __future__ import annotations
 
 import contextlib
-from datetime import timedelta
-from typing import TYPE_CHECKING
+import time
+from typing import TYPE_CHECKING, Any, Iterable
 
 import discord
 
@@ -17,45 +17,51 @@ class Paginator(discord.ui.View):
 
     def __init__(
         self,
-        _embeds: list[discord.Embed | embeds.GenjiEmbed | str],
+        _embeds: Iterable[discord.Embed | embeds.GenjiEmbed | str],
         author: discord.Member | discord.User,
         timeout: int = 600,
     ) -> None:
         """Init paginator."""
         super().__init__(timeout=timeout)
-        self.pages = _embeds
+        self.pages = list(_embeds)
+        self._n_pages = len(self.pages)
         self.author = author
         self._curr_page = 0
-        self.page_number.label = f"1/{len(self.pages)}"
-        if len(self.pages) == 1:
+        self._page_labels = [f"{i}/{self._n_pages}" for i in range(1, self._n_pages + 1)]
+        self.page_number.label = self._page_labels[0]
+        if self._n_pages == 1:
             self.first.disabled = True
             self.back.disabled = True
             self.next.disabled = True
             self.last.disabled = True
         self.end_time = ""
+        self._end_prefix = "\n"
         self.original_itx = None
         self._timeout = timeout
         if timeout is not None:
             self._update_end_time()
+        else:
+            self._render_payloads()
 
     def _update_end_time(self) -> None:
-        time = discord.utils.format_dt(discord.utils.utcnow() + timedelta(seconds=self._timeout), "R")
         self.timeout = self._timeout
-        self.end_time = "This search will time out " + time
+        # Same output as discord.utils.format_dt(..., "R") without building a datetime.
+        self.end_time = f"This search will time out <t:{int(time.time()) + self._timeout}:R>"
+        self._end_prefix = self.end_time + "\n"
+        self._render_payloads()
+
+    def _render(self, page: discord.Embed | embeds.GenjiEmbed | str) -> dict[str, Any]:
+        """Return the edit kwargs that show a page; string pages have no embed key."""
+        if isinstance(page, str):
+            return {"content": self._end_prefix + page}
+        return {"content": self.end_time, "embed": page}
+
+    def _render_payloads(self) -> None:
+        self._payloads = [self._render(page) for page in self.pages]
 
     async def start(self, itx: discord.Interaction[core.Genji]) -> None:
         """Start the pagination view."""
-        if isinstance(self.pages[0], str):
-            await itx.edit_original_response(
-                content=self.end_time + "\n" + self.pages[0],
-                view=self,
-            )
-        else:
-            await itx.edit_original_response(
-                content=self.end_time,
-                embed=self.pages[0],
-                view=self,
-            )
+        await itx.edit_original_response(**self._payloads[0], view=self)
         self.original_itx = itx
         await self.wait()
 
@@ -65,17 +71,22 @@ class Paginator(discord.ui.View):
 
     async def on_timeout(self) -> None:
         """Stop view on timeout."""
+        # Nothing to clean up if the paginator was never shown or its buttons were already removed.
+        if self.original_itx is None or not self.children:
+            return await super().on_timeout()
         self.clear_items()
         with contextlib.suppress(discord.HTTPException):
-            if isinstance(self.pages[self._curr_page], str):
+            payload = self._payloads[self._curr_page]
+            if "embed" not in payload:
+                # Drop the timeout notice from string pages.
                 await self.original_itx.edit_original_response(
-                    content=self.pages[self._curr_page],
+                    content=payload["content"].removeprefix(self._end_prefix),
                     view=self,
                 )
             else:
                 await self.original_itx.edit_original_response(
                     content=None,
-                    embed=self.pages[self._curr_page],
+                    embed=payload["embed"],
                     view=self,
                 )
 
@@ -84,42 +95,34 @@ class Paginator(discord.ui.View):
     @discord.ui.button(label="First", emoji="⏮")
     async def first(self, itx: discord.Interaction[core.Genji], button: discord.ui.Button) -> None:
         """Button component to return to the first pagination page."""
-        if len(self.pages) == 1:
-            button.disabled = True
-        self._curr_page = 0
-        return await self.change_page(itx)
+        return await self._goto(itx, 0, absolute=True)
 
     @discord.ui.button(label="Back", emoji="◀")
     async def back(self, itx: discord.Interaction[core.Genji], button: discord.ui.Button) -> None:
         """Button component to go back to the last pagination page."""
-        if len(self.pages) == 1:
-            button.disabled = True
-        if self._curr_page == 0:
-            self._curr_page = len(self.pages) - 1
-        else:
-            self._curr_page -= 1
-
-        return await self.change_page(itx)
+        return await self._goto(itx, -1)
+
+    async def _goto(self, itx: discord.Interaction[core.Genji], page: int, *, absolute: bool = False) -> None:
+        """Move to page, or by page relative to the current one, wrapping around at either end.
+
+        Staying on the same page only acknowledges the interaction rather than editing the message.
+        """
+        new_page = page if absolute else (self._curr_page + page) % self._n_pages
+        if new_page == self._curr_page:
+            if not itx.response.is_done():
+                await itx.response.defer()
+            return
+        self._curr_page = new_page
+        await self.change_page(itx)
 
     async def change_page(self, itx: discord.Interaction[core.Genji]) -> None:
         """Change the current page in paginator."""
-        self.page_number.label = f"{self._curr_page + 1}/{len(self.pages)}"
-        try:
-            if isinstance(self.pages[self._curr_page], str):
-                await itx.response.edit_message(
-                    content=self.end_time + "\n" + self.pages[self._curr_page],
-                    view=self,
-                )
-            else:
-                await itx.response.edit_message(content=self.end_time, embed=self.pages[self._curr_page], view=self)
-        except discord.errors.InteractionResponded:
-            if isinstance(self.pages[self._curr_page], str):
-                await itx.edit_original_response(
-                    content=self.end_time + "\n" + self.pages[self._curr_page],
-                    view=self,
-                )
-            else:
-                await itx.edit_original_response(content=self.end_time, embed=self.pages[self._curr_page], view=self)
+        payload = self._payloads[self._curr_page]
+        if self._n_pages > 1:
+            self.page_number.label = self._page_labels[self._curr_page]
+        # The page number modal has already responded to the interaction, so edit the original instead.
+        send = itx.edit_original_response if itx.response.is_done() else itx.response.edit_message
+        await send(**payload, view=self)
 
     @discord.ui.button(label="...")
     async def page_number(
@@ -128,33 +131,23 @@ class Paginator(discord.ui.View):
         button: discord.ui.Button,
     ) -> None:
         """Button component to open page number selection modal."""
-        modal = PageNumberModal(len(self.pages))
+        modal = PageNumberModal(self._n_pages)
         await itx.response.send_modal(modal)
         await modal.wait()
-        number = int(modal.number.value)
-        self._curr_page = number - 1
-        await self.change_page(itx)
+        # value is only set once the modal has validated the input.
+        if modal.value is None:
+            return
+        await self._goto(itx, modal.value - 1, absolute=True)
 
     @discord.ui.button(label="Next", emoji="▶")
     async def next(self, itx: discord.Interaction[core.Genji], button: discord.ui.Button) -> None:
         """Button component to go to the next pagination page."""
-        if len(self.pages) == 1:
-            button.disabled = True
-        if self._curr_page == len(self.pages) - 1:
-            self._curr_page = 0
-        else:
-            self._curr_page += 1
-
-        return await self.change_page(itx)
+        return await self._goto(itx, 1)
 
     @discord.ui.button(label="Last", emoji="⏭")
     async def last(self, itx: discord.Interaction[core.Genji], button: discord.ui.Button) -> None:
         """Button component to go to the last pagination page."""
-        if len(self.pages) == 1:
-            button.disabled = True
-        self._curr_page = len(self.pages) - 1
-
-        return await self.change_page(itx)
+        return await self._goto(itx, self._n_pages - 1, absolute=True)
 
 
 class PageNumberModal(discord.ui.Modal):
@@ -170,17 +163,15 @@ class PageNumberModal(discord.ui.Modal):
 
     async def on_submit(self, itx: discord.Interaction[core.Genji]) -> None:
         """Page number selection modal callback."""
-        await itx.response.defer(ephemeral=True, thinking=True)
-
         try:
-            self.value = int(self.number.value)
-            if not 1 <= self.value <= self.limit:
-                raise errors.OutOfRangeError
+            value = int(self.number.value)
         except ValueError:
             raise errors.InvalidIntegerError
-
-        if self.value:
-            await itx.delete_original_response()
+        if not 1 <= value <= self.limit:
+            raise errors.OutOfRangeError
+        self.value = value
+        # Without thinking there is no placeholder response to delete afterwards.
+        await itx.response.defer()
 
     async def on_error(self, itx: discord.Interaction[core.Genji], error: Exception) -> None:
         """Error handler for Page number selection modal."""
@@ -1,8 +1,8 @@
 from __future__ import annotations
 
+import asyncio
 import typing
 
-import asyncpg
 import discord.ui
 
 from utils import utils
@@ -21,6 +21,14 @@ def bool_string(value: bool) -> str:
 
 ENABLED_EMOJI = "🔔"
 DISABLED_EMOJI = "🔕"
+_STYLE_ON = discord.ButtonStyle.green
+_STYLE_OFF = discord.ButtonStyle.red
+
+
+_NOTIFICATION_LABELS = {
+    flag: tuple(f"{name} Notifications are {bool_string(state)}" for state in (False, True))
+    for flag, name in ((utils.SettingFlags.VERIFICATION, "Verification"), (utils.SettingFlags.PROMOTION, "Promotion"))
+}
 
 
 class SettingsView(discord.ui.View):
@@ -30,10 +38,40 @@ class SettingsView(discord.ui.View):
         super().__init__(timeout=3600)
         self.itx = original_itx
         self.flags = utils.SettingFlags(flags)
-        self.verification = NotificationButton("Verification", utils.SettingFlags.VERIFICATION in self.flags)
-        self.add_item(self.verification)
-        self.promotion = NotificationButton("Promotion", utils.SettingFlags.PROMOTION in self.flags)
-        self.add_item(self.promotion)
+        self.edit_button(self.verification, utils.SettingFlags.VERIFICATION)
+        self.edit_button(self.promotion, utils.SettingFlags.PROMOTION)
+
+    def edit_button(self, button: discord.ui.Button, flag: utils.SettingFlags) -> None:
+        """Edit a notification button to match its flag."""
+        value = flag in self.flags
+        button.label = _NOTIFICATION_LABELS[flag][value]
+        button.emoji = ENABLED_EMOJI if value else DISABLED_EMOJI
+        button.style = _STYLE_ON if value else _STYLE_OFF
+
+    async def toggle_notification(
+        self,
+        itx: discord.Interaction[core.Genji],
+        button: discord.ui.Button,
+        flag: utils.SettingFlags,
+    ) -> None:
+        """Toggle a notification flag and save it."""
+        await itx.response.defer(ephemeral=True)
+        self.flags ^= flag
+        self.edit_button(button, flag)
+        await asyncio.gather(
+            self.itx.edit_original_response(view=self),
+            itx.client.database.update_user_flags(itx.user.id, self.flags),
+        )
+
+    @discord.ui.button(row=0)
+    async def verification(self, itx: discord.Interaction[core.Genji], button: discord.ui.Button) -> None:
+        """Verification notification button callback."""
+        await self.toggle_notification(itx, button, utils.SettingFlags.VERIFICATION)
+
+    @discord.ui.button(row=0)
+    async def promotion(self, itx: discord.Interaction[core.Genji], button: discord.ui.Button) -> None:
+        """Promotion notification button callback."""
+        await self.toggle_notification(itx, button, utils.SettingFlags.PROMOTION)
 
     @discord.ui.button(label="Change Name", style=discord.ButtonStyle.blurple, row=1)
     async def name_change(self, itx: discord.Interaction[core.Genji], button: discord.ui.Button) -> None:
@@ -41,35 +79,6 @@ class SettingsView(discord.ui.View):
         await itx.response.send_modal(NameChangeModal())
 
 
-class NotificationButton(discord.ui.Button):
-    """Notification settings button."""
-
-    view: SettingsView
-
-    def __init__(self, name: str, value: bool) -> None:
-        self.name = name
-        super().__init__()
-        self.edit_button(name, value)
-
-    async def callback(self, itx: discord.Interaction[core.Genji]) -> None:
-        """Notification button callback."""
-        await itx.response.defer(ephemeral=True)
-        self.view.flags ^= getattr(utils.SettingFlags, self.name.upper())
-        self.edit_button(self.name, getattr(utils.SettingFlags, self.name.upper()) in self.view.flags)
-        await self.view.itx.edit_original_response(view=self.view)
-        await itx.client.database.execute(
-            "UPDATE users SET flags = $1 WHERE user_id = $2;",
-            self.view.flags,
-            itx.user.id,
-        )
-
-    def edit_button(self, name: str, value: bool) -> None:
-        """Edit button."""
-        self.label = f"{name} Notifications are {bool_string(value)}"
-        self.emoji = ENABLED_EMOJI if value else DISABLED_EMOJI
-        self.style = discord.ButtonStyle.green if value else discord.ButtonStyle.red
-
-
 class NameChangeModal(discord.ui.Modal, title="Change Name"):
     """Name change modal."""
 
@@ -77,16 +86,14 @@ class NameChangeModal(discord.ui.Modal, title="Change Name"):
         label="Nickname",
         style=discord.TextStyle.short,
         placeholder="Write your most commonly known nickname/alias.",
+        max_length=25,
     )
 
     async def on_submit(self, itx: discord.Interaction[core.Genji]) -> None:
         """Name change modal callback."""
-        await itx.response.send_message(f"You have changed your display name to {self.name}!", ephemeral=True)
-
-        await itx.client.database.execute(
-            "UPDATE users SET nickname = $1 WHERE user_id = $2;",
-            self.name.value[:25],
-            itx.user.id,
+        await asyncio.gather(
+            itx.response.send_message(f"You have changed your display name to {self.name}!", ephemeral=True),
+            itx.client.database.update_user_nickname(itx.user.id, self.name.value),
         )
 
 
@@ -118,9 +125,9 @@ class OverwatchUsernameModal(discord.ui.Modal, title="Add Overwatch Username"):
     async def on_submit(self, itx: discord.Interaction[core.Genji]) -> None:
         """Username modal callback."""
         await itx.response.send_message(f"Added Overwatch username: {self.username.value}", ephemeral=True)
-        query = "INSERT INTO user_overwatch_usernames (user_id, username, is_primary) VALUES ($1, $2, $3);"
-        try:
-            await itx.client.database.execute(query, itx.user.id, self.username.value, True)
-        except asyncpg.UniqueViolationError:
-            ...
+        query = """
+            INSERT INTO user_overwatch_usernames (user_id, username, is_primary) VALUES ($1, $2, $3)
+            ON CONFLICT DO NOTHING;
+        """
+        await itx.client.database.execute(query, itx.user.id, self.username.value, True)
 